@@ -11,6 +11,7 @@ The client implements all login and logout procedures and is part of every API a
 import base64 
 import asyncio
 import logging
+import time
 
 from datetime import datetime
 
@@ -25,6 +26,7 @@ from dracoon.errors import (HTTPTooManyRequestsError, MissingCredentialsError, H
 # constants for client config
 USER_AGENT = 'dracoon-python-1.12.0'
 DEFAULT_TIMEOUT_CONFIG = httpx.Timeout(10, connect=30, read=30)
+DEFAULT_LIMITS_CONFIG = httpx.Limits(max_connections=1000, max_keepalive_connections=100, keepalive_expiry=30.0)
 RETRY_CONFIG_BASE = RetryConfig(retry=retry_if_exception_type((HTTPTooManyRequestsError, HTTPServerError, ConnectionError)),
                            stop=stop_after_attempt(5),
                            wait=wait_exponential(multiplier=1.2, min=5, max=15),
@@ -48,8 +50,8 @@ class DRACOONClient:
                  raise_on_err: bool = False, proxy_config: ProxyConfig = None):
         """ client is initialized with DRACOON instance details (url and OAuth client credentials) """
         
-        # custom transport for retries on connection errors
-        DEFAULT_HTTPX_TRANSPORT = httpx.AsyncHTTPTransport(retries=5)
+        # custom transport for retries on connection errors (pool limits keep connections alive across requests)
+        DEFAULT_HTTPX_TRANSPORT = httpx.AsyncHTTPTransport(retries=5, limits=DEFAULT_LIMITS_CONFIG)
         
         self.base_url = base_url
         self.client_id = client_id
@@ -63,6 +65,9 @@ class DRACOONClient:
         else:
             self.redirect_uri = f"{self.base_url}/oauth/callback"
         self.connection: DRACOONConnection = None
+        self._auth_valid_until: float = 0.0
+        # created lazily to bind to the running event loop (python 3.9)
+        self._auth_lock: asyncio.Lock = None
         self.raise_on_err = raise_on_err
         self.logger = logging.getLogger('dracoon.client')
         self.logger.info("DRACOON client created.")
@@ -190,6 +195,7 @@ class DRACOONClient:
                                          res.json()["refresh_token"])
 
         self.connected = True
+        self._auth_valid_until = time.monotonic() + self.connection.access_token_validity
         self.http.headers["Authorization"] = "Bearer " + self.connection.access_token
   
         return self.connection
@@ -228,6 +234,7 @@ class DRACOONClient:
 
         self.connected = False
         self.connection = None
+        self._auth_valid_until = 0.0
         await self.disconnect()
 
     async def check_access_token(self, test: bool = False):
@@ -270,6 +277,26 @@ class DRACOONClient:
         return await self.check_access_token()
 
 
+    async def _ensure_auth(self):
+        """ refresh access token if expired – skips the check while the token is known to be valid """
+        if time.monotonic() < self._auth_valid_until - 5:
+            return
+
+        if self._auth_lock is None:
+            self._auth_lock = asyncio.Lock()
+
+        # single refresh for concurrent requests – re-check once another task released the lock
+        async with self._auth_lock:
+            if time.monotonic() < self._auth_valid_until - 5:
+                return
+
+            if not await self.test_connection() and self.connection:
+                await self.connect(OAuth2ConnectionType.refresh_token)
+            elif self.connection:
+                elapsed = (datetime.now() - self.connection.connected_at).total_seconds()
+                self._auth_valid_until = time.monotonic() + self.connection.access_token_validity - elapsed
+
+
     async def handle_http_error(self, err: httpx.HTTPStatusError, raise_on_err: bool, is_xml: bool = False, close_client: bool = False, debug_content: bool = True):
         """ handle http error in httpx client """
         if self.raise_on_err:
@@ -293,7 +320,7 @@ class DRACOONClient:
         """ handle connection error in httpx client """
         self.logger.critical("Connection error.")
         self.logger.critical(err.request.url)
-        raise ConnectionError()
+        raise ConnectionError() from err
 
     async def handle_generic_error(self, err: Exception, close_client: bool = False):
         """ handle generic non-connection / non-http error """
@@ -68,7 +68,7 @@ class DRACOONEvents:
 
         api_url = self.api_url + f'/audits/nodes/?offset={offset}'
         if filter != None: api_url += f'&filter={filter}' 
-        if limit != None: api_url += f'&limit={str(limit)}' 
+        if limit != None: api_url += f'&limit={limit}' 
         if sort != None: api_url += f'&sort={sort}' 
 
         try:
@@ -97,9 +97,9 @@ class DRACOONEvents:
         
         if filter: filter = urllib.parse.quote(filter)
 
-        api_url = self.api_url + f'/audits/node_info/?parent_id={str(parent_id)}&offset={offset}'
+        api_url = self.api_url + f'/audits/node_info/?parent_id={parent_id}&offset={offset}'
         if filter != None: api_url += f'&filter={filter}' 
-        if limit != None: api_url += f'&limit={str(limit)}' 
+        if limit != None: api_url += f'&limit={limit}' 
         if sort != None: api_url += f'&sort={sort}'
 
         try:
@@ -129,10 +129,10 @@ class DRACOONEvents:
         api_url = self.api_url + f'/events/?offset={offset}'
         if date_start != None: api_url += f'&date_start={date_start}'
         if date_end != None: api_url += f'&date_end={date_end}'
-        if operation_id != None: api_url += f'&type={str(operation_id)}'
-        if user_id != None: api_url += f'&user_id={str(user_id)}'
+        if operation_id != None: api_url += f'&type={operation_id}'
+        if user_id != None: api_url += f'&user_id={user_id}'
         if filter != None: api_url += f'&filter={filter}' 
-        if limit != None: api_url += f'&limit={str(limit)}' 
+        if limit != None: api_url += f'&limit={limit}' 
         if sort != None: api_url += f'&sort={sort}' 
 
         try:
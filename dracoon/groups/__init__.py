@@ -103,7 +103,7 @@ class DRACOONGroups:
 
         api_url = self.api_url + f'/?offset={offset}'
         if filter != None: api_url += f'&filter={filter}' 
-        if limit != None: api_url += f'&limit={str(limit)}' 
+        if limit != None: api_url += f'&limit={limit}' 
         if sort != None: api_url += f'&sort={sort}' 
 
         try:
@@ -128,7 +128,7 @@ class DRACOONGroups:
         if self.raise_on_err:
             raise_on_err = True
         
-        api_url = self.api_url + f'/{str(group_id)}'
+        api_url = self.api_url + f'/{group_id}'
 
         try:
             res = await self.dracoon.http.get(api_url)
@@ -152,7 +152,7 @@ class DRACOONGroups:
         if self.raise_on_err:
             raise_on_err = True
 
-        api_url = self.api_url + f'/{str(group_id)}'
+        api_url = self.api_url + f'/{group_id}'
 
         payload = group_update.dict(exclude_unset=True)
 
@@ -186,7 +186,7 @@ class DRACOONGroups:
         if self.raise_on_err:
             raise_on_err = True
 
-        api_url = self.api_url + f'/{str(group_id)}'
+        api_url = self.api_url + f'/{group_id}'
 
         try:
             res = await self.dracoon.http.delete(api_url)
@@ -211,9 +211,9 @@ class DRACOONGroups:
         
         if filter: filter = urllib.parse.quote(filter)
 
-        api_url = self.api_url + f'/{group_id}/users/?offset={str(offset)}'
+        api_url = self.api_url + f'/{group_id}/users/?offset={offset}'
         if filter != None: api_url += f'&filter={filter}' 
-        if limit != None: api_url += f'&limit={str(limit)}' 
+        if limit != None: api_url += f'&limit={limit}' 
         if sort != None: api_url += f'&sort={sort}' 
 
         try:
@@ -237,7 +237,7 @@ class DRACOONGroups:
         if self.raise_on_err:
             raise_on_err = True
 
-        api_url = self.api_url + f'/{str(group_id)}/last_admin_rooms'
+        api_url = self.api_url + f'/{group_id}/last_admin_rooms'
 
         try:
             res = await self.dracoon.http.get(api_url)
@@ -260,7 +260,7 @@ class DRACOONGroups:
         if self.raise_on_err:
             raise_on_err = True
 
-        api_url = self.api_url + f'/{str(group_id)}/roles'
+        api_url = self.api_url + f'/{group_id}/roles'
 
         try:
             res = await self.dracoon.http.get(api_url)
@@ -285,7 +285,7 @@ class DRACOONGroups:
             raise_on_err = True
         
  
-        api_url = self.api_url + f'/{str(group_id)}/users'
+        api_url = self.api_url + f'/{group_id}/users'
 
         payload = {
             "ids": user_list
@@ -312,7 +312,7 @@ class DRACOONGroups:
         if self.raise_on_err:
             raise_on_err = True
 
-        api_url = self.api_url + f'/{str(group_id)}/users'
+        api_url = self.api_url + f'/{group_id}/users'
 
         payload = {
             "ids": user_list
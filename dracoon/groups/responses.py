@@ -6,7 +6,7 @@ from enum import Enum
 from dracoon.user.responses import RoleList
 from dracoon.client.models import Range
 
-class UserType(Enum):
+class UserType(str, Enum):
     internal = "internal"
     external = "external"
     system = "system"
@@ -198,7 +198,7 @@ class DRACOONNodes:
         if self.raise_on_err:
             raise_on_err = True
 
-        api_url = self.api_url + f'/search?search_string={last_node}&filter={filter_str}&depth_level={str(depth)}'
+        api_url = self.api_url + f'/search?search_string={last_node}&filter={filter_str}&depth_level={depth}'
 
         try:
             res = await self.dracoon.http.get(url=api_url)
@@ -901,11 +901,11 @@ class DRACOONNodes:
         if filter: filter = urllib.parse.quote(filter)
 
         api_url = self.api_url + \
-            f'/?offset={offset}&parent_id={str(parent_id)}&room_manager={str(room_manager).lower()}'
+            f'/?offset={offset}&parent_id={parent_id}&room_manager={str(room_manager).lower()}'
         if filter != None:
             api_url += f'&filter={filter}'
         if limit != None:
-            api_url += f'&limit={str(limit)}'
+            api_url += f'&limit={limit}'
         if sort != None:
             api_url += f'&sort={sort}'
 
@@ -957,7 +957,7 @@ class DRACOONNodes:
         if self.raise_on_err:
             raise_on_err = True
 
-        api_url = self.api_url + f'/{str(node_id)}'
+        api_url = self.api_url + f'/{node_id}'
 
         try:
             res = await self.dracoon.http.get(api_url)
@@ -981,7 +981,7 @@ class DRACOONNodes:
         if self.raise_on_err:
             raise_on_err = True
 
-        api_url = self.api_url + f'/{str(node_id)}'
+        api_url = self.api_url + f'/{node_id}'
 
         try:
             res = await self.dracoon.http.delete(api_url)
@@ -1006,7 +1006,7 @@ class DRACOONNodes:
             raise_on_err = True
 
         api_url = self.api_url + \
-            f'/{str(node_id)}/comments/?offset={str(offset)}'
+            f'/{node_id}/comments/?offset={offset}'
 
         try:
             res = await self.dracoon.http.get(api_url)
@@ -1032,7 +1032,7 @@ class DRACOONNodes:
         if not await self.dracoon.test_connection() and self.dracoon.connection:
             await self.dracoon.connect(OAuth2ConnectionType.refresh_token)
 
-        api_url = self.api_url + f'/{str(node_id)}/comments'
+        api_url = self.api_url + f'/{node_id}/comments'
         try:
             res = await self.dracoon.http.post(api_url, json=payload)
 
@@ -1065,7 +1065,7 @@ class DRACOONNodes:
         if self.raise_on_err:
             raise_on_err = True
 
-        api_url = self.api_url + f'/{str(target_id)}/copy_to'
+        api_url = self.api_url + f'/{target_id}/copy_to'
         try:
             res = await self.dracoon.http.post(api_url, json=payload)
 
@@ -1116,12 +1116,12 @@ class DRACOONNodes:
         if filter: filter = urllib.parse.quote(filter)
 
         api_url = self.api_url + \
-            f'/{str(parent_id)}/deleted_nodes/?offset={offset}'
+            f'/{parent_id}/deleted_nodes/?offset={offset}'
 
         if filter != None:
             api_url += f'&filter={filter}'
         if limit != None:
-            api_url += f'&limit={str(limit)}'
+            api_url += f'&limit={limit}'
         if sort != None:
             api_url += f'&sort={sort}'
 
@@ -1148,7 +1148,7 @@ class DRACOONNodes:
         if self.raise_on_err:
             raise_on_err = True
 
-        api_url = self.api_url + f'/{str(parent_id)}/deleted_nodes'
+        api_url = self.api_url + f'/{parent_id}/deleted_nodes'
 
         try:
             res = await self.dracoon.http.delete(api_url)
@@ -1174,7 +1174,7 @@ class DRACOONNodes:
         
         name = urllib.parse.quote(name)
         
-        api_url = self.api_url + f'/{str(parent_id)}/deleted_nodes/versions?name={name}&type={type}&offset={offset}'
+        api_url = self.api_url + f'/{parent_id}/deleted_nodes/versions?name={name}&type={type}&offset={offset}'
 
         try:
             res = await self.dracoon.http.get(api_url)
@@ -1199,7 +1199,7 @@ class DRACOONNodes:
         if self.raise_on_err:
             raise_on_err = True
 
-        api_url = self.api_url + f'/{str(node_id)}/favorite'
+        api_url = self.api_url + f'/{node_id}/favorite'
         try:
             res = await self.dracoon.http.post(api_url)
 
@@ -1222,7 +1222,7 @@ class DRACOONNodes:
         if self.raise_on_err:
             raise_on_err = True
 
-        api_url = self.api_url + f'/{str(node_id)}/favorite'
+        api_url = self.api_url + f'/{node_id}/favorite'
 
         try:
             res = await self.dracoon.http.delete(api_url)
@@ -1247,7 +1247,7 @@ class DRACOONNodes:
         if self.raise_on_err:
             raise_on_err = True
 
-        api_url = self.api_url + f'/{str(target_id)}/move_to'
+        api_url = self.api_url + f'/{target_id}/move_to'
         try:
             res = await self.dracoon.http.post(api_url, json=payload)
 
@@ -1270,7 +1270,7 @@ class DRACOONNodes:
         if self.raise_on_err:
             raise_on_err = True
 
-        api_url = self.api_url + f'/{str(node_id)}/parents'
+        api_url = self.api_url + f'/{node_id}/parents'
 
         try:
             res = await self.dracoon.http.get(api_url)
@@ -1321,7 +1321,7 @@ class DRACOONNodes:
         if self.raise_on_err:
             raise_on_err = True
 
-        api_url = self.api_url + f'/deleted_nodes/{str(node_id)}'
+        api_url = self.api_url + f'/deleted_nodes/{node_id}'
 
         try:
             res = await self.dracoon.http.get(api_url)
@@ -1384,7 +1384,7 @@ class DRACOONNodes:
         if self.raise_on_err:
             raise_on_err = True
 
-        api_url = self.api_url + f'/files/{str(file_id)}'
+        api_url = self.api_url + f'/files/{file_id}'
 
         payload = file_update.dict(exclude_unset=True)
 
@@ -1466,7 +1466,7 @@ class DRACOONNodes:
         if self.raise_on_err:
             raise_on_err = True
 
-        api_url = self.api_url + f'/files/{str(node_id)}/downloads'
+        api_url = self.api_url + f'/files/{node_id}/downloads'
         try:
             res = await self.dracoon.http.post(api_url)
             res.raise_for_status()
@@ -1487,7 +1487,7 @@ class DRACOONNodes:
         if self.raise_on_err:
             raise_on_err = True
 
-        api_url = self.api_url + f'/files/{str(file_id)}/user_file_key'
+        api_url = self.api_url + f'/files/{file_id}/user_file_key'
 
         if version: api_url += f'/?version={version}'
 
@@ -1554,7 +1554,7 @@ class DRACOONNodes:
         if self.raise_on_err:
             raise_on_err = True
 
-        api_url = self.api_url + f'/files/versions/{str(reference_id)}'
+        api_url = self.api_url + f'/files/versions/{reference_id}'
 
         try:
             res = await self.dracoon.http.get(api_url)
@@ -1627,7 +1627,7 @@ class DRACOONNodes:
         if self.raise_on_err:
             raise_on_err = True
 
-        api_url = self.api_url + f'/folders/{str(node_id)}'
+        api_url = self.api_url + f'/folders/{node_id}'
 
         payload = folder_update.dict(exclude_unset=True)
 
@@ -1653,18 +1653,18 @@ class DRACOONNodes:
         if self.raise_on_err:
             raise_on_err = True
 
-        api_url = self.api_url + f'/missingFileKeys/?offset={str(offset)}'
+        api_url = self.api_url + f'/missingFileKeys/?offset={offset}'
 
         if file_id != None:
-            api_url += f'&file_id={str(file_id)}'
+            api_url += f'&file_id={file_id}'
         if room_id != None:
-            api_url += f'&room_id={str(room_id)}'
+            api_url += f'&room_id={room_id}'
         if user_id != None:
-            api_url += f'&user_id={str(user_id)}'
+            api_url += f'&user_id={user_id}'
         if use_key != None:
             api_url += f'&use_key={use_key}'
         if limit != None:
-            api_url += f'&limit={str(limit)}'
+            api_url += f'&limit={limit}'
 
         try:
             res = await self.dracoon.http.get(api_url)
@@ -1714,7 +1714,7 @@ class DRACOONNodes:
         if self.raise_on_err:
             raise_on_err = True
 
-        api_url = self.api_url + f'/rooms/{str(node_id)}'
+        api_url = self.api_url + f'/rooms/{node_id}'
 
         payload = room_update.dict(exclude_unset=True)
 
@@ -1778,7 +1778,7 @@ class DRACOONNodes:
         if self.raise_on_err:
             raise_on_err = True
 
-        api_url = self.api_url + f'/rooms/{str(node_id)}/config'
+        api_url = self.api_url + f'/rooms/{node_id}/config'
 
         payload = config_update.dict(exclude_unset=True)
 
@@ -1864,7 +1864,7 @@ class DRACOONNodes:
         if self.raise_on_err:
             raise_on_err = True
 
-        api_url = self.api_url + f'/rooms/{str(room_id)}/encrypt'
+        api_url = self.api_url + f'/rooms/{room_id}/encrypt'
         
         payload = encrypt_room.dict(exclude_unset=True)
             
@@ -1890,14 +1890,14 @@ class DRACOONNodes:
             raise_on_err = True
 
         api_url = self.api_url + \
-            f'/rooms/{str(room_id)}/groups/?offset={str(offset)}'
+            f'/rooms/{room_id}/groups/?offset={offset}'
         
         if filter: filter = urllib.parse.quote(filter)
 
         if filter != None:
             api_url += f'&filter={filter}'
         if limit != None:
-            api_url += f'&limit={str(limit)}'
+            api_url += f'&limit={limit}'
         if sort != None:
             api_url += f'&sort={sort}'
 
@@ -1923,7 +1923,7 @@ class DRACOONNodes:
         if self.raise_on_err:
             raise_on_err = True
 
-        api_url = self.api_url + f'/rooms/{str(room_id)}/groups'
+        api_url = self.api_url + f'/rooms/{room_id}/groups'
 
         payload = groups_update.dict(exclude_unset=True)
 
@@ -1952,7 +1952,7 @@ class DRACOONNodes:
         payload = {
             "ids": group_list
         }
-        api_url = self.api_url + f'/rooms/{str(room_id)}/groups'
+        api_url = self.api_url + f'/rooms/{room_id}/groups'
 
         try:
             res = await self.dracoon.http.request(method='DELETE', url=api_url, json=payload, headers=self.dracoon.http.headers)
@@ -1979,12 +1979,12 @@ class DRACOONNodes:
         if filter: filter = urllib.parse.quote(filter)
 
         api_url = self.api_url + \
-            f'/rooms/{str(room_id)}/users/?offset={str(offset)}'
+            f'/rooms/{room_id}/users/?offset={offset}'
 
         if filter != None:
             api_url += f'&filter={filter}'
         if limit != None:
-            api_url += f'&limit={str(limit)}'
+            api_url += f'&limit={limit}'
         if sort != None:
             api_url += f'&sort={sort}'
 
@@ -2009,7 +2009,7 @@ class DRACOONNodes:
         if self.raise_on_err:
             raise_on_err = True
 
-        api_url = self.api_url + f'/rooms/{str(room_id)}/users'
+        api_url = self.api_url + f'/rooms/{room_id}/users'
 
         payload = users_update.dict(exclude_unset=True)
 
@@ -2017,9 +2017,6 @@ class DRACOONNodes:
             res = await self.dracoon.http.put(url=api_url, json=payload)
 
             res.raise_for_status()
-        except httpx.RequestError as e:
-            raise httpx.RequestError(
-                f'Connection to DRACOON failed: {e.request.url}')
         except httpx.RequestError as e:
             await self.dracoon.handle_connection_error(e)
         except httpx.HTTPStatusError as e:
@@ -2042,7 +2039,7 @@ class DRACOONNodes:
             "ids": user_list
         }
 
-        api_url = self.api_url + f'/rooms/{str(room_id)}/users'
+        api_url = self.api_url + f'/rooms/{room_id}/users'
         try:
             res = await self.dracoon.http.request(method='DELETE', url=api_url, json=payload, headers=self.dracoon.http.headers)
 
@@ -2068,12 +2065,12 @@ class DRACOONNodes:
         if filter: filter = urllib.parse.quote(filter)
 
         api_url = self.api_url + \
-            f'/rooms/{str(node_id)}/webhooks/?offset={str(offset)}'
+            f'/rooms/{node_id}/webhooks/?offset={offset}'
 
         if filter != None:
             api_url += f'&filter={filter}'
         if limit != None:
-            api_url += f'&limit={str(limit)}'
+            api_url += f'&limit={limit}'
         if sort != None:
             api_url += f'&sort={sort}'
 
@@ -2099,7 +2096,7 @@ class DRACOONNodes:
         if self.raise_on_err:
             raise_on_err = True
 
-        api_url = self.api_url + f'/rooms/{str(node_id)}/webhooks'
+        api_url = self.api_url + f'/rooms/{node_id}/webhooks'
 
         payload = hook_update.dict(exclude_unset=True)
 
@@ -2128,14 +2125,14 @@ class DRACOONNodes:
             
         if filter: filter = urllib.parse.quote(filter)
 
-        api_url = self.api_url + f'/rooms/{room_id}/events/?offset={str(offset)}'
+        api_url = self.api_url + f'/rooms/{room_id}/events/?offset={offset}'
 
         if date_start != None: api_url += f'&date_start={date_start}'
         if date_end != None: api_url += f'&date_end={date_end}'
-        if operation_id != None: api_url += f'&type={str(operation_id)}'
-        if user_id != None: api_url += f'&user_id={str(user_id)}'
+        if operation_id != None: api_url += f'&type={operation_id}'
+        if user_id != None: api_url += f'&user_id={user_id}'
         if filter != None: api_url += f'&filter={filter}' 
-        if limit != None: api_url += f'&limit={str(limit)}' 
+        if limit != None: api_url += f'&limit={limit}' 
         if sort != None: api_url += f'&sort={sort}' 
 
         try:
@@ -2161,14 +2158,14 @@ class DRACOONNodes:
         if self.raise_on_err:
             raise_on_err = True
 
-        api_url = self.api_url + f'/rooms/pending/?offset={str(offset)}'
+        api_url = self.api_url + f'/rooms/pending/?offset={offset}'
         
         if filter: filter = urllib.parse.quote(filter)
 
         if filter != None:
             api_url += f'&filter={filter}'
         if limit != None:
-            api_url += f'&limit={str(limit)}'
+            api_url += f'&limit={limit}'
         if sort != None:
             api_url += f'&sort={sort}'
 
@@ -2226,12 +2223,12 @@ class DRACOONNodes:
         if filter: filter = urllib.parse.quote(filter)
 
         api_url = self.api_url + \
-            f'/search/?search_string={search}&offset={str(offset)}&parent_id={str(parent_id)}&depth_level={depth_level}'
+            f'/search/?search_string={search}&offset={offset}&parent_id={parent_id}&depth_level={depth_level}'
 
         if filter != None:
             api_url += f'&filter={filter}'
         if limit != None:
-            api_url += f'&limit={str(limit)}'
+            api_url += f'&limit={limit}'
         if sort != None:
             api_url += f'&sort={sort}'
 
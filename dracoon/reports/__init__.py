@@ -157,7 +157,7 @@ class DRACOONReports:
         if name:
             api_url += f"&name={name}"
         if limit != None:
-            api_url += f"&limit={str(limit)}"
+            api_url += f"&limit={limit}"
         if sort != None:
             api_url += f"&sort={sort}"
         if type != None:
@@ -223,7 +223,7 @@ class DRACOONReports:
         if self.raise_on_err:
             raise_on_err = True
 
-        api_url = self.api_url + f"/{str(report_id)}"
+        api_url = self.api_url + f"/{report_id}"
 
         try:
             res = await self.dracoon.http.delete(api_url)
@@ -12,17 +12,23 @@ Please note: maximum 500 items are returned in GET requests
 
 """
 
-from typing import List
+from typing import List, Optional, Tuple, Union
+import asyncio
 import httpx
 import logging
-import urllib.parse
+import time
 from tenacity import retry
 
-from dracoon.client import DRACOONClient, OAuth2ConnectionType, RETRY_CONFIG
+from dracoon.client import DRACOONClient, RETRY_CONFIG
 from dracoon.errors import InvalidArgumentError, InvalidClientError, ClientDisconnectedError
 from .models import CreateWebhook, UpdateSettings, UpdateWebhook
 from .responses import EventTypeList, WebhookList, Webhook, CustomerSettingsResponse
 
+# webhook event types are static per DRACOON instance – cache for 60 minutes
+EVENT_TYPES_CACHE_TTL = 3600
+# payloads are serialized by pydantic and sent as raw content
+JSON_HEADERS = {"Content-Type": "application/json"}
+
 class DRACOONSettings:
 
     """
@@ -41,6 +47,14 @@ class DRACOONSettings:
         if dracoon_client.connection:
             self.dracoon = dracoon_client
             self.api_url = self.dracoon.base_url + self.dracoon.api_base_url + '/settings'
+            self._routes = {
+                'settings': self.api_url,
+                'webhooks': self.api_url + '/webhooks',
+                'webhook_list': self.api_url + '/webhooks/',
+                'webhook_by_id': self.api_url + '/webhooks/{}',
+                'event_types': self.api_url + '/webhooks/event_types',
+            }
+            self._event_types_cache: Optional[Tuple[float, EventTypeList]] = None
 
             if self.dracoon.raise_on_err:
                 self.raise_on_err = True
@@ -53,14 +67,13 @@ class DRACOONSettings:
     @retry(**RETRY_CONFIG)
     async def get_settings(self, raise_on_err: bool = False) -> CustomerSettingsResponse:
         """ list customer settings (home rooms) """
-        if not await self.dracoon.test_connection() and self.dracoon.connection:
-            await self.dracoon.connect(OAuth2ConnectionType.refresh_token)
+        await self.dracoon._ensure_auth()
 
         if self.raise_on_err:
             raise_on_err = True
 
         try:
-            res = await self.dracoon.http.get(self.api_url)
+            res = await self.dracoon.http.get(self._routes['settings'])
 
             res.raise_for_status()
         except httpx.RequestError as e:
@@ -70,21 +83,20 @@ class DRACOONSettings:
             await self.dracoon.handle_http_error(err=e, raise_on_err=raise_on_err)
         
         self.logger.info("Retrieved customer settings.")
-        return CustomerSettingsResponse(**res.json())
+        return CustomerSettingsResponse.from_trusted(res.json())
 
     @retry(**RETRY_CONFIG)
     async def update_settings(self, settings_update: UpdateSettings, raise_on_err: bool = False) -> CustomerSettingsResponse:
         """ update customer settings (home rooms) """
-        if not await self.dracoon.test_connection() and self.dracoon.connection:
-            await self.dracoon.connect(OAuth2ConnectionType.refresh_token)
+        await self.dracoon._ensure_auth()
 
         if self.raise_on_err:
             raise_on_err = True
 
-        payload = settings_update.dict(exclude_unset=True)
+        payload = settings_update.model_dump_json(exclude_unset=True).encode()
 
         try:
-            res = await self.dracoon.http.put(url=self.api_url, json=payload)
+            res = await self.dracoon.http.put(url=self._routes['settings'], content=payload, headers=JSON_HEADERS)
 
             res.raise_for_status()
         except httpx.RequestError as e:
@@ -94,39 +106,32 @@ class DRACOONSettings:
             await self.dracoon.handle_http_error(err=e, raise_on_err=raise_on_err)
         
         self.logger.info("Updated customer settings.")
-        return CustomerSettingsResponse(**res.json())
+        return CustomerSettingsResponse.from_trusted(res.json())
     
     def make_settings_update(self, home_rooms_active: bool = None, home_room_quota: int = None, home_room_parent_name: str = None, raise_on_err: bool = False) -> UpdateSettings:
         """ make a settings update payload required for update_settings() """
-        settings_update = {}
-
         if home_rooms_active == False:
             raise InvalidArgumentError(message='Home rooms cannot be deactivated')
 
-        if home_rooms_active is not None: settings_update["homeRoomsActive"] = home_rooms_active
-        if home_room_quota: settings_update["homeRoomQuota"] = home_room_quota
-        if home_room_parent_name: settings_update["homeRoomParentName"] = home_room_parent_name
+        settings_update = {k: v for k, v in (
+            ("homeRoomsActive", home_rooms_active), ("homeRoomQuota", home_room_quota),
+            ("homeRoomParentName", home_room_parent_name)
+        ) if v is not None}
 
         return UpdateSettings(**settings_update)
 
     @retry(**RETRY_CONFIG)
     async def get_webhooks(self, offset: int = 0, filter: str = None, limit: int = None, sort: str = None, raise_on_err: bool = False) -> WebhookList:
         """ list (all) webhooks """
-        if not await self.dracoon.test_connection() and self.dracoon.connection:
-            await self.dracoon.connect(OAuth2ConnectionType.refresh_token)
+        await self.dracoon._ensure_auth()
 
         if self.raise_on_err:
             raise_on_err = True
-        
-        if filter: filter = urllib.parse.quote(filter)
 
-        api_url = self.api_url + f'/webhooks/?offset={offset}'
-        if filter != None: api_url += f'&filter={filter}' 
-        if limit != None: api_url += f'&limit={str(limit)}' 
-        if sort != None: api_url += f'&sort={sort}' 
+        params = {k: v for k, v in dict(offset=offset, filter=filter, limit=limit, sort=sort).items() if v is not None}
 
         try:
-            res = await self.dracoon.http.get(api_url)
+            res = await self.dracoon.http.get(self._routes['webhook_list'], params=params)
             res.raise_for_status()
         except httpx.RequestError as e:
             await self.dracoon.handle_connection_error(e)
@@ -135,23 +140,21 @@ class DRACOONSettings:
             await self.dracoon.handle_http_error(err=e, raise_on_err=raise_on_err)
         
         self.logger.info("Retrieved webhooks.")
-        return WebhookList(**res.json())
+        return WebhookList.model_validate_json(res.content)
 
 
     @retry(**RETRY_CONFIG)
     async def create_webhook(self, hook: CreateWebhook, raise_on_err: bool = False) -> Webhook:
         """ creates a new webhook """
-        payload = hook.dict(exclude_unset=True)
+        payload = hook.model_dump_json(exclude_unset=True).encode()
 
-        if not await self.dracoon.test_connection() and self.dracoon.connection:
-            await self.dracoon.connect(OAuth2ConnectionType.refresh_token)
+        await self.dracoon._ensure_auth()
 
         if self.raise_on_err:
             raise_on_err = True
 
-        api_url = self.api_url + f'/webhooks'
         try:
-            res = await self.dracoon.http.post(api_url, json=payload)
+            res = await self.dracoon.http.post(self._routes['webhooks'], content=payload, headers=JSON_HEADERS)
 
             res.raise_for_status()
         except httpx.RequestError as e:
@@ -161,34 +164,39 @@ class DRACOONSettings:
             await self.dracoon.handle_http_error(err=e, raise_on_err=raise_on_err)
         
         self.logger.info("Created webhook.")
-        return Webhook(**res.json())
+        return Webhook.model_validate_json(res.content)
+
+    async def create_webhooks(self, hooks: List[CreateWebhook], concurrency: int = 32) -> List[Union[Webhook, Exception]]:
+        """ creates multiple webhooks concurrently (max. concurrency parallel requests) – failed items are returned as DRACOON errors """
+        # refresh token once instead of per request
+        await self.dracoon._ensure_auth()
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def create(hook: CreateWebhook) -> Webhook:
+            async with semaphore:
+                return await self.create_webhook(hook=hook, raise_on_err=True)
+
+        return await asyncio.gather(*[create(hook) for hook in hooks], return_exceptions=True)
 
     def make_webhook(self, name: str, event_types: List[str], url: str, secret: str = None, 
                      is_enabled: bool = None, trigger_example: bool = None) -> CreateWebhook:
         """ make a new webhook creation payload required for create_webhook() """
-        webhook = {
-            "name": name,
-            "eventTypeNames": event_types,
-            "url": url
-        }
-        
-        if secret: webhook["secret"] = secret
-        if is_enabled is not None: webhook["isEnabled"] = is_enabled
-        if trigger_example is not None: webhook["triggerExampleEvent"] = trigger_example
+        webhook = {k: v for k, v in (
+            ("name", name), ("eventTypeNames", event_types), ("url", url),
+            ("secret", secret), ("isEnabled", is_enabled),
+            ("triggerExampleEvent", trigger_example)
+        ) if v is not None}
 
         return CreateWebhook(**webhook)
 
     def make_webhook_update(self, name: str = None, event_types: List[str] = None, url: str = None, secret: str = None, 
                      is_enabled: bool = None, trigger_example: bool = None) -> UpdateWebhook:
         """ make a new webhook update payload required for update_webhook() """
-        webhook = {}
-        
-        if name: webhook["name"] = name
-        if event_types: webhook["eventTypeNames"] = event_types
-        if url: webhook["url"] = url
-        if secret: webhook["secret"] = secret
-        if is_enabled is not None: webhook["isEnabled"] = is_enabled
-        if trigger_example is not None: webhook["triggerExampleEvent"] = trigger_example
+        webhook = {k: v for k, v in (
+            ("name", name), ("eventTypeNames", event_types), ("url", url),
+            ("secret", secret), ("isEnabled", is_enabled),
+            ("triggerExampleEvent", trigger_example)
+        ) if v is not None}
 
         return UpdateWebhook(**webhook)
 
@@ -196,13 +204,12 @@ class DRACOONSettings:
     @retry(**RETRY_CONFIG)
     async def get_webhook(self, hook_id: int, raise_on_err: bool = False) -> Webhook:
         """ get webhook details for specific user (by id) """
-        if not await self.dracoon.test_connection() and self.dracoon.connection:
-            await self.dracoon.connect(OAuth2ConnectionType.refresh_token)
+        await self.dracoon._ensure_auth()
 
         if self.raise_on_err:
             raise_on_err = True
 
-        api_url = self.api_url + f'/webhooks/{str(hook_id)}'
+        api_url = self._routes['webhook_by_id'].format(hook_id)
 
         try:
             res = await self.dracoon.http.get(api_url)
@@ -215,23 +222,22 @@ class DRACOONSettings:
             await self.dracoon.handle_http_error(err=e, raise_on_err=raise_on_err)
         
         self.logger.info("Retrieved webhook.")
-        return Webhook(**res.json())
+        return Webhook.model_validate_json(res.content)
 
     @retry(**RETRY_CONFIG)
     async def update_webhook(self, hook_id: int, hook_update: UpdateWebhook, raise_on_err: bool = False) -> Webhook:
 
-        payload = hook_update.dict(exclude_unset=True)
+        payload = hook_update.model_dump_json(exclude_unset=True).encode()
 
-        if not await self.dracoon.test_connection() and self.dracoon.connection:
-            await self.dracoon.connect(OAuth2ConnectionType.refresh_token)
+        await self.dracoon._ensure_auth()
 
         if self.raise_on_err:
             raise_on_err = True
 
-        api_url = self.api_url + f'/webhooks/{str(hook_id)}'
+        api_url = self._routes['webhook_by_id'].format(hook_id)
 
         try:
-            res = await self.dracoon.http.put(api_url, json=payload)
+            res = await self.dracoon.http.put(api_url, content=payload, headers=JSON_HEADERS)
 
             res.raise_for_status()
         except httpx.RequestError as e:
@@ -241,18 +247,17 @@ class DRACOONSettings:
             await self.dracoon.handle_http_error(err=e, raise_on_err=raise_on_err)
         
         self.logger.info("Updated webhook.")
-        return Webhook(**res.json())
+        return Webhook.model_validate_json(res.content)
 
 
     @retry(**RETRY_CONFIG)
     async def delete_webhook(self, hook_id: int, raise_on_err: bool = False) -> None:
-        if not await self.dracoon.test_connection() and self.dracoon.connection:
-            await self.dracoon.connect(OAuth2ConnectionType.refresh_token)
+        await self.dracoon._ensure_auth()
 
         if self.raise_on_err:
             raise_on_err = True
 
-        api_url = self.api_url + f'/webhooks/{str(hook_id)}'
+        api_url = self._routes['webhook_by_id'].format(hook_id)
 
         try:
             res = await self.dracoon.http.delete(api_url)
@@ -264,20 +269,32 @@ class DRACOONSettings:
             await self.dracoon.handle_http_error(err=e, raise_on_err=raise_on_err)
         self.logger.info("Deleted webhook.")
         return None
+
+    async def delete_webhooks(self, hook_ids: List[int], concurrency: int = 32) -> List[Union[None, Exception]]:
+        """ deletes multiple webhooks concurrently (max. concurrency parallel requests) – failed items are returned as DRACOON errors """
+        # refresh token once instead of per request
+        await self.dracoon._ensure_auth()
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def delete(hook_id: int) -> None:
+            async with semaphore:
+                return await self.delete_webhook(hook_id=hook_id, raise_on_err=True)
+
+        return await asyncio.gather(*[delete(hook_id) for hook_id in hook_ids], return_exceptions=True)
     
     @retry(**RETRY_CONFIG)
     async def get_webhook_event_types(self, raise_on_err: bool = False) -> EventTypeList:
+        """ list available webhook event types (cached, see invalidate_event_types()) """
+        if self._event_types_cache and time.monotonic() - self._event_types_cache[0] < EVENT_TYPES_CACHE_TTL:
+            return self._event_types_cache[1]
 
-        if not await self.dracoon.test_connection() and self.dracoon.connection:
-            await self.dracoon.connect(OAuth2ConnectionType.refresh_token)
+        await self.dracoon._ensure_auth()
 
         if self.raise_on_err:
             raise_on_err = True
 
-        api_url = self.api_url + f'/webhooks/event_types'
-
         try:
-            res = await self.dracoon.http.get(api_url)
+            res = await self.dracoon.http.get(self._routes['event_types'])
 
             res.raise_for_status()
         except httpx.RequestError as e:
@@ -287,4 +304,10 @@ class DRACOONSettings:
             await self.dracoon.handle_http_error(err=e, raise_on_err=raise_on_err)
         
         self.logger.info("Retrieved webhook event types.")
-        return EventTypeList(**res.json())
\ No newline at end of file
+        event_types = EventTypeList.from_trusted(res.json())
+        self._event_types_cache = (time.monotonic(), event_types)
+        return event_types
+
+    def invalidate_event_types(self) -> None:
+        """ clear cached webhook event types – next get_webhook_event_types() call fetches them again """
+        self._event_types_cache = None
\ No newline at end of file
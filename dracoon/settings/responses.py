@@ -5,12 +5,22 @@ from typing import Optional, List
 from dracoon.nodes.responses import Webhook
 from dracoon.client.models import Range
 
+# skip validation for flat responses parsed via from_trusted() – set to False to always validate
+TRUSTED_RESPONSES = True
+
 class CustomerSettingsResponse(BaseModel):
     homeRoomsActive: bool
     homeRoomParentId: Optional[int] = None
     homeRoomParentName: Optional[str] = None
     homeRoomQuota: Optional[int] = None
 
+    @classmethod
+    def from_trusted(cls, data: dict) -> 'CustomerSettingsResponse':
+        """ build from a DRACOON API response without validation (if TRUSTED_RESPONSES is set) – validates error bodies """
+        if not TRUSTED_RESPONSES or not isinstance(data, dict) or "homeRoomsActive" not in data:
+            return cls.model_validate(data)
+        return cls.model_construct(**data)
+
 class WebhookList(BaseModel):
     range: Range
     items: List[Webhook]
@@ -24,4 +34,11 @@ class EventType(BaseModel):
     usablePushNotification: bool
 
 class EventTypeList(BaseModel):
-    items: List[EventType]
\ No newline at end of file
+    items: List[EventType]
+
+    @classmethod
+    def from_trusted(cls, data: dict) -> 'EventTypeList':
+        """ build from a DRACOON API response without validation (if TRUSTED_RESPONSES is set) – validates error bodies """
+        if not TRUSTED_RESPONSES or not isinstance(data, dict) or not isinstance(data.get("items"), list):
+            return cls.model_validate(data)
+        return cls.model_construct(items=[EventType.model_construct(**item) for item in data["items"]])
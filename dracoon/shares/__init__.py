@@ -63,7 +63,7 @@ class DRACOONShares:
 
         api_url = self.api_url + f'/downloads?offset={offset}'
         if filter != None: api_url += f'&filter={filter}' 
-        if limit != None: api_url += f'&limit={str(limit)}' 
+        if limit != None: api_url += f'&limit={limit}' 
         if sort != None: api_url += f'&sort={sort}' 
 
         try:
@@ -163,7 +163,7 @@ class DRACOONShares:
         if self.raise_on_err:
             raise_on_err = True
 
-        api_url = self.api_url + f'/downloads/{str(share_id)}'
+        api_url = self.api_url + f'/downloads/{share_id}'
 
         try:
             res = await self.dracoon.http.get(api_url)
@@ -259,7 +259,7 @@ class DRACOONShares:
         if self.raise_on_err:
             raise_on_err = True
 
-        api_url = self.api_url + f'/downloads/{str(share_id)}'
+        api_url = self.api_url + f'/downloads/{share_id}'
 
         payload = share_update.dict(exclude_unset=True)
 
@@ -285,7 +285,7 @@ class DRACOONShares:
         if self.raise_on_err:
             raise_on_err = True
 
-        api_url = self.api_url + f'/downloads/{str(share_id)}'
+        api_url = self.api_url + f'/downloads/{share_id}'
 
         try:
             res = await self.dracoon.http.delete(api_url)
@@ -311,7 +311,7 @@ class DRACOONShares:
         if self.raise_on_err:
             raise_on_err = True
 
-        api_url = self.api_url + f'/downloads/{str(share_id)}/email'
+        api_url = self.api_url + f'/downloads/{share_id}/email'
 
         try:
             res = await self.dracoon.http.post(api_url, json=payload)
@@ -340,7 +340,7 @@ class DRACOONShares:
 
         api_url = self.api_url + f'/uploads?offset={offset}'
         if filter != None: api_url += f'&filter={filter}' 
-        if limit != None: api_url += f'&limit={str(limit)}' 
+        if limit != None: api_url += f'&limit={limit}' 
         if sort != None: api_url += f'&sort={sort}' 
 
         try:
@@ -442,7 +442,7 @@ class DRACOONShares:
         if self.raise_on_err:
             raise_on_err = True
 
-        api_url = self.api_url + f'/uploads/{str(file_request_id)}'
+        api_url = self.api_url + f'/uploads/{file_request_id}'
 
         try:
             res = await self.dracoon.http.get(api_url)
@@ -543,7 +543,7 @@ class DRACOONShares:
         if self.raise_on_err:
             raise_on_err = True
 
-        api_url = self.api_url + f'/uploads/{str(file_request_id)}'
+        api_url = self.api_url + f'/uploads/{file_request_id}'
 
         payload = file_request_update.dict(exclude_unset=True)
 
@@ -569,7 +569,7 @@ class DRACOONShares:
         if self.raise_on_err:
             raise_on_err = True
 
-        api_url = self.api_url + f'/uploads/{str(file_request_id)}'
+        api_url = self.api_url + f'/uploads/{file_request_id}'
 
         try:
             res = await self.dracoon.http.delete(api_url)
@@ -595,7 +595,7 @@ class DRACOONShares:
         if self.raise_on_err:
             raise_on_err = True
 
-        api_url = self.api_url + f'/uploads/{str(file_request_id)}/email'
+        api_url = self.api_url + f'/uploads/{file_request_id}/email'
 
         try:
             res = await self.dracoon.http.post(api_url, json=payload)
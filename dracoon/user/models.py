@@ -1,3 +1,4 @@
+import warnings
 from pydantic import BaseModel
 from typing import List, Optional
 from datetime import datetime
@@ -32,7 +33,7 @@ class UserAccount(BaseModel):
     userRoles: RoleList
     language: str
     authData: UserAuthData
-    mudtSetEmail: Optional[bool] = None
+    mustSetEmail: Optional[bool] = None
     needsToAcceptEULA: Optional[bool] = None
     isEncryptionEnabled: Optional[bool] = None
     lastLoginSuccessAt: Optional[datetime] = None
@@ -42,7 +43,13 @@ class UserAccount(BaseModel):
     homeRoomId: Optional[int] = None
     userGroups: Optional[List[UserGroup]] = None
 
-class UserType(Enum):
+    @property
+    def mudtSetEmail(self) -> Optional[bool]:
+        """ deprecated (misspelled) – use mustSetEmail """
+        warnings.warn("UserAccount.mudtSetEmail is deprecated, use mustSetEmail", DeprecationWarning, stacklevel=2)
+        return self.mustSetEmail
+
+class UserType(str, Enum):
     internal = "internal"
     external = "external"
     system = "system"
@@ -204,7 +204,7 @@ class DRACOONUsers:
 
         api_url = self.api_url + f'/?offset={offset}'
         if filter != None: api_url += f'&filter={filter}' 
-        if limit != None: api_url += f'&limit={str(limit)}' 
+        if limit != None: api_url += f'&limit={limit}' 
         if sort != None: api_url += f'&sort={sort}'
         if include_attributes: api_url += f'&include_attributes=true'
         if include_roles: api_url += f'&include_roles=true'
@@ -227,7 +227,7 @@ class DRACOONUsers:
         if not await self.dracoon.test_connection() and self.dracoon.connection:
             await self.dracoon.connect(OAuth2ConnectionType.refresh_token)
 
-        api_url = self.api_url + f'/{str(user_id)}'
+        api_url = self.api_url + f'/{user_id}'
 
         try:
             res = await self.dracoon.http.get(api_url)
@@ -249,7 +249,7 @@ class DRACOONUsers:
         if not await self.dracoon.test_connection() and self.dracoon.connection:
             await self.dracoon.connect(OAuth2ConnectionType.refresh_token)
 
-        api_url = self.api_url + f'/{str(user_id)}'
+        api_url = self.api_url + f'/{user_id}'
 
         payload = user_update.dict(exclude_unset=True)
 
@@ -271,7 +271,7 @@ class DRACOONUsers:
         if not await self.dracoon.test_connection() and self.dracoon.connection:
             await self.dracoon.connect(OAuth2ConnectionType.refresh_token)
 
-        api_url = self.api_url + f'/{str(user_id)}'
+        api_url = self.api_url + f'/{user_id}'
 
         try:
             res = await self.dracoon.http.delete(api_url)
@@ -295,9 +295,9 @@ class DRACOONUsers:
         
         if filter: filter = urllib.parse.quote(filter)
 
-        api_url = self.api_url + f'/{user_id}/groups/?offset={str(offset)}'
+        api_url = self.api_url + f'/{user_id}/groups/?offset={offset}'
         if filter != None: api_url += f'&filter={filter}' 
-        if limit != None: api_url += f'&limit={str(limit)}' 
+        if limit != None: api_url += f'&limit={limit}' 
         if sort != None: api_url += f'&sort={sort}' 
 
         try:
@@ -319,7 +319,7 @@ class DRACOONUsers:
         if not await self.dracoon.test_connection() and self.dracoon.connection:
             await self.dracoon.connect(OAuth2ConnectionType.refresh_token)
 
-        api_url = self.api_url + f'/{str(user_id)}/last_admin_rooms'
+        api_url = self.api_url + f'/{user_id}/last_admin_rooms'
 
         try:
             res = await self.dracoon.http.get(api_url)
@@ -339,7 +339,7 @@ class DRACOONUsers:
         if not await self.dracoon.test_connection() and self.dracoon.connection:
             await self.dracoon.connect(OAuth2ConnectionType.refresh_token)
 
-        api_url = self.api_url + f'/{str(user_id)}/roles'
+        api_url = self.api_url + f'/{user_id}/roles'
 
         try:
             res = await self.dracoon.http.get(api_url)
@@ -363,9 +363,9 @@ class DRACOONUsers:
         
         if filter: filter = urllib.parse.quote(filter)
 
-        api_url = self.api_url + f'/{user_id}/userAttributes/?offset={str(offset)}'
+        api_url = self.api_url + f'/{user_id}/userAttributes/?offset={offset}'
         if filter != None: api_url += f'&filter={filter}' 
-        if limit != None: api_url += f'&limit={str(limit)}' 
+        if limit != None: api_url += f'&limit={limit}' 
         if sort != None: api_url += f'&sort={sort}' 
 
         try:
@@ -387,7 +387,7 @@ class DRACOONUsers:
         if not await self.dracoon.test_connection() and self.dracoon.connection:
             await self.dracoon.connect(OAuth2ConnectionType.refresh_token)
 
-        api_url = self.api_url + f'/{str(user_id)}/userAttributes/{key}'
+        api_url = self.api_url + f'/{user_id}/userAttributes/{key}'
 
         try:
             res = await self.dracoon.http.delete(api_url)
@@ -408,7 +408,7 @@ class DRACOONUsers:
         if not await self.dracoon.test_connection() and self.dracoon.connection:
             await self.dracoon.connect(OAuth2ConnectionType.refresh_token)
 
-        api_url = self.api_url + f'/{str(user_id)}/userAttributes'
+        api_url = self.api_url + f'/{user_id}/userAttributes'
         payload = attributes.dict(exclude_unset=True)
 
         try:
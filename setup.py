@@ -31,5 +31,5 @@ setup(
     ],
     packages=find_packages(),
     include_package_data=True,
-    install_requires=["httpx", "asyncio", "pydantic", "cryptography", "tenacity"]
+    install_requires=["httpx", "asyncio", "pydantic>=2.0.0", "cryptography", "tenacity"]
 )
\ No newline at end of file
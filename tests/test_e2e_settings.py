@@ -66,6 +66,16 @@ class TestAsyncDRACOONPublic(unittest.IsolatedAsyncioTestCase):
         self.assertIsInstance(webhook, Webhook)
         await self.settings.delete_webhook(hook_id=webhook.id)
 
+    async def test_create_delete_webhooks(self):
+        webhook_payloads = [self.settings.make_webhook(name=f'BULK TEST {i}', event_types=["file.created"], url="https://hooks.unbekanntespferd.com/test", trigger_example=False) for i in range(3)]
+        webhooks = await self.settings.create_webhooks(hooks=webhook_payloads)
+        self.assertEqual(len(webhooks), len(webhook_payloads))
+        for webhook in webhooks:
+            self.assertIsInstance(webhook, Webhook)
+
+        del_webhooks = await self.settings.delete_webhooks(hook_ids=[webhook.id for webhook in webhooks])
+        self.assertEqual(del_webhooks, [None, None, None])
+
     async def test_update_webhook(self):
         
         webhook_payload = self.settings.make_webhook(name='UPDATE TEST', event_types=["file.created"], url="https://hooks.unbekanntespferd.com/test", trigger_example=False)
@@ -96,6 +106,11 @@ class TestAsyncDRACOONPublic(unittest.IsolatedAsyncioTestCase):
     async def test_get_webhook_eventtypes(self):
         event_types = await self.settings.get_webhook_event_types()
         self.assertIsInstance(event_types, EventTypeList)
+        cached_event_types = await self.settings.get_webhook_event_types()
+        self.assertIs(cached_event_types, event_types)
+        self.settings.invalidate_event_types()
+        refreshed_event_types = await self.settings.get_webhook_event_types()
+        self.assertIsNot(refreshed_event_types, event_types)
 
 class TestAsyncDRACOONServerPublic(unittest.IsolatedAsyncioTestCase):
     async def asyncSetUp(self) -> None:
@@ -145,6 +160,16 @@ class TestAsyncDRACOONServerPublic(unittest.IsolatedAsyncioTestCase):
         self.assertIsInstance(webhook, Webhook)
         await self.settings.delete_webhook(hook_id=webhook.id)
 
+    async def test_create_delete_webhooks(self):
+        webhook_payloads = [self.settings.make_webhook(name=f'BULK TEST {i}', event_types=["file.created"], url="https://hooks.unbekanntespferd.com/test", trigger_example=False) for i in range(3)]
+        webhooks = await self.settings.create_webhooks(hooks=webhook_payloads)
+        self.assertEqual(len(webhooks), len(webhook_payloads))
+        for webhook in webhooks:
+            self.assertIsInstance(webhook, Webhook)
+
+        del_webhooks = await self.settings.delete_webhooks(hook_ids=[webhook.id for webhook in webhooks])
+        self.assertEqual(del_webhooks, [None, None, None])
+
     async def test_update_webhook(self):
         
         webhook_payload = self.settings.make_webhook(name='UPDATE TEST', event_types=["file.created"], url="https://hooks.unbekanntespferd.com/test", trigger_example=False)
@@ -175,6 +200,11 @@ class TestAsyncDRACOONServerPublic(unittest.IsolatedAsyncioTestCase):
     async def test_get_webhook_eventtypes(self):
         event_types = await self.settings.get_webhook_event_types()
         self.assertIsInstance(event_types, EventTypeList)
+        cached_event_types = await self.settings.get_webhook_event_types()
+        self.assertIs(cached_event_types, event_types)
+        self.settings.invalidate_event_types()
+        refreshed_event_types = await self.settings.get_webhook_event_types()
+        self.assertIsNot(refreshed_event_types, event_types)
 
 if __name__ == '__main__':
     unittest.main()
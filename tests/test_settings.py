@@ -0,0 +1,206 @@
+import asyncio
+import time
+import unittest
+from unittest.mock import patch
+from datetime import datetime, timedelta
+
+import httpx
+from pydantic import ValidationError
+
+from dracoon.client import DRACOONClient
+from dracoon.client.models import DRACOONConnection
+from dracoon.errors import HTTPNotFoundError
+from dracoon.settings import DRACOONSettings, EVENT_TYPES_CACHE_TTL
+from dracoon.settings.responses import CustomerSettingsResponse, EventTypeList
+
+ERROR_BODY = {"code": 403, "message": "Forbidden", "debugInfo": "Forbidden", "errorCode": -10003}
+TOKEN_BODY = {"access_token": "new_access_token", "expires_in": 3600, "refresh_token": "new_refresh_token"}
+SETTINGS_BODY = {"homeRoomsActive": True, "homeRoomQuota": 1000}
+EVENT_TYPES_BODY = {"items": [{"id": 1, "name": "file.created", "usableTenantWebhook": True, "usableCustomerAdminWebhook": True,
+                               "usableNodeWebhook": True, "usablePushNotification": False}]}
+
+class TestDRACOONSettingsResponses(unittest.TestCase):
+
+    def test_customer_settings_from_trusted(self):
+
+        customer_settings = CustomerSettingsResponse.from_trusted({"homeRoomsActive": True, "homeRoomQuota": 1000})
+
+        self.assertIsInstance(customer_settings, CustomerSettingsResponse)
+        self.assertTrue(customer_settings.homeRoomsActive)
+        self.assertEqual(customer_settings.homeRoomQuota, 1000)
+
+    def test_customer_settings_from_trusted_error_body(self):
+
+        with self.assertRaises(ValidationError):
+            CustomerSettingsResponse.from_trusted(ERROR_BODY)
+
+    def test_event_types_from_trusted_error_body(self):
+
+        with self.assertRaises(ValidationError):
+            EventTypeList.from_trusted(ERROR_BODY)
+
+
+class TestAsyncDRACOONSettingsErrors(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self) -> None:
+
+        self.dracoon = DRACOONClient(base_url='https://just.a.test.com')
+        await self.dracoon.http.aclose()
+        self.dracoon.http = httpx.AsyncClient(transport=httpx.MockTransport(lambda request: httpx.Response(403, json=ERROR_BODY)))
+        self.dracoon.connection = DRACOONConnection(datetime.now(), 'access_token', 3600, 'refresh_token')
+        self.dracoon.connected = True
+
+        self.settings = DRACOONSettings(dracoon_client=self.dracoon)
+
+    async def asyncTearDown(self) -> None:
+        await self.dracoon.disconnect()
+
+    async def test_get_settings_error(self):
+
+        with self.assertRaises(ValidationError):
+            await self.settings.get_settings()
+
+    async def test_get_webhook_event_types_error(self):
+
+        with self.assertRaises(ValidationError):
+            await self.settings.get_webhook_event_types()
+        self.assertIsNone(self.settings._event_types_cache)
+
+
+class TestAsyncDRACOONSettingsEventTypes(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self) -> None:
+
+        self.requests = []
+        self.dracoon = DRACOONClient(base_url='https://just.a.test.com')
+        await self.dracoon.http.aclose()
+        self.dracoon.http = httpx.AsyncClient(transport=httpx.MockTransport(self.handle_request))
+        self.dracoon.connection = DRACOONConnection(datetime.now(), 'access_token', 3600, 'refresh_token')
+        self.dracoon.connected = True
+
+        self.settings = DRACOONSettings(dracoon_client=self.dracoon)
+
+    async def asyncTearDown(self) -> None:
+        await self.dracoon.disconnect()
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        return httpx.Response(200, json=EVENT_TYPES_BODY)
+
+    async def test_get_webhook_event_types_cached(self):
+
+        event_types = await self.settings.get_webhook_event_types()
+        cached_event_types = await self.settings.get_webhook_event_types()
+
+        self.assertIsInstance(event_types, EventTypeList)
+        self.assertIs(cached_event_types, event_types)
+        self.assertEqual(len(self.requests), 1)
+
+    async def test_invalidate_event_types(self):
+
+        event_types = await self.settings.get_webhook_event_types()
+        self.settings.invalidate_event_types()
+        refreshed_event_types = await self.settings.get_webhook_event_types()
+
+        self.assertIsNot(refreshed_event_types, event_types)
+        self.assertEqual(len(self.requests), 2)
+
+    async def test_event_types_cache_expired(self):
+
+        event_types = await self.settings.get_webhook_event_types()
+        with patch('time.monotonic', return_value=time.monotonic() + EVENT_TYPES_CACHE_TTL + 1):
+            refreshed_event_types = await self.settings.get_webhook_event_types()
+
+        self.assertIsNot(refreshed_event_types, event_types)
+        self.assertEqual(len(self.requests), 2)
+
+
+class TestAsyncDRACOONClientAuth(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self) -> None:
+
+        self.requests = []
+        self.dracoon = DRACOONClient(base_url='https://just.a.test.com')
+        await self.dracoon.http.aclose()
+        self.dracoon.http = httpx.AsyncClient(transport=httpx.MockTransport(self.handle_request))
+        self.dracoon.connected = True
+
+    async def asyncTearDown(self) -> None:
+        await self.dracoon.disconnect()
+
+    async def handle_request(self, request: httpx.Request) -> httpx.Response:
+        # yield to the event loop like a real network request
+        await asyncio.sleep(0)
+        self.requests.append(request)
+        if request.url.path == '/oauth/token':
+            return httpx.Response(200, json=TOKEN_BODY)
+        return httpx.Response(200, json=SETTINGS_BODY)
+
+    def token_requests(self):
+        return [request for request in self.requests if request.url.path == '/oauth/token']
+
+    async def test_ensure_auth_fresh_token(self):
+
+        self.dracoon.connection = DRACOONConnection(datetime.now(), 'access_token', 3600, 'refresh_token')
+        settings = DRACOONSettings(dracoon_client=self.dracoon)
+
+        for _ in range(3):
+            await settings.get_settings()
+
+        self.assertEqual(len(self.token_requests()), 0)
+        self.assertEqual(len(self.requests), 3)
+
+    async def test_ensure_auth_single_refresh(self):
+
+        self.dracoon.connection = DRACOONConnection(datetime.now() - timedelta(hours=2), 'access_token', 3600, 'refresh_token')
+
+        await asyncio.gather(*[self.dracoon._ensure_auth() for _ in range(10)])
+
+        self.assertEqual(len(self.token_requests()), 1)
+        self.assertEqual(self.dracoon.connection.access_token, TOKEN_BODY["access_token"])
+        self.assertEqual(self.dracoon.connection.refresh_token, TOKEN_BODY["refresh_token"])
+
+
+class TestAsyncDRACOONSettingsWebhooks(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self) -> None:
+
+        self.requests = []
+        self.dracoon = DRACOONClient(base_url='https://just.a.test.com')
+        await self.dracoon.http.aclose()
+        self.dracoon.http = httpx.AsyncClient(transport=httpx.MockTransport(self.handle_request))
+        self.dracoon.connection = DRACOONConnection(datetime.now() - timedelta(hours=2), 'access_token', 3600, 'refresh_token')
+        self.dracoon.connected = True
+
+        self.settings = DRACOONSettings(dracoon_client=self.dracoon)
+
+    async def asyncTearDown(self) -> None:
+        await self.dracoon.disconnect()
+
+    async def handle_request(self, request: httpx.Request) -> httpx.Response:
+        # yield to the event loop like a real network request
+        await asyncio.sleep(0)
+        self.requests.append(request)
+        if request.url.path == '/oauth/token':
+            return httpx.Response(200, json=TOKEN_BODY)
+        # webhooks with odd ids do not exist
+        if int(request.url.path.rsplit('/', 1)[-1]) % 2:
+            return httpx.Response(404, json=ERROR_BODY)
+        return httpx.Response(204)
+
+    async def test_delete_webhooks(self):
+
+        del_webhooks = await self.settings.delete_webhooks(hook_ids=list(range(10)))
+
+        token_requests = [request for request in self.requests if request.url.path == '/oauth/token']
+        self.assertEqual(len(token_requests), 1)
+        self.assertEqual(len(del_webhooks), 10)
+        for hook_id, del_webhook in enumerate(del_webhooks):
+            if hook_id % 2:
+                self.assertIsInstance(del_webhook, HTTPNotFoundError)
+            else:
+                self.assertIsNone(del_webhook)
+
+
+if __name__ == '__main__':
+    unittest.main()